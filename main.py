@@ -11,8 +11,8 @@ Características solicitadas:
 
 Estructura general y diseño
 ---------------------------
-1) Producto: entidad simple con ID, nombre, cantidad y precio. Usa @property para getters/setters
-   con validaciones básicas.
+1) Producto: entidad simple con ID, nombre, cantidad y precio. Usa __slots__ para reducir
+   memoria por instancia; las validaciones básicas se aplican al construir y al actualizar.
 2) Inventario: mantiene un diccionario {id: Producto} para búsquedas O(1) por ID. Además
    expone métodos CRUD y sincroniza los cambios con SQLite.
 3) SQLite: una tabla 'productos' con columnas (id INTEGER PRIMARY KEY, nombre TEXT UNIQUE,
@@ -20,8 +20,11 @@ Estructura general y diseño
 4) Colecciones:
    - dict[int, Producto] para el índice principal del inventario.
    - list[Producto] como resultados de consultas (mostrar todo, buscar por nombre).
-   - set[str] para nombres ya usados (apoya validación y ejemplo de colección).
+   - dict[str, Producto] como índice por nombre exacto (búsqueda O(1) y validación de unicidad,
+     respaldada además por la restricción UNIQUE de SQLite).
+   - set[int]/set[str] para detectar IDs o nombres repetidos dentro de un alta masiva.
    - tuple para retornos inmutables (por ejemplo, snapshots con to_tuple()).
+   - array (columnas paralelas de cantidades y precios) para agregados como el valor total.
 5) Interfaz de usuario por consola (menú): añade, elimina, actualiza, busca y lista productos.
 
 Nota: Este script es autocontenido. Basta con ejecutar `python main.py` para crear/usar la BD
@@ -30,116 +33,295 @@ en el archivo `inventario.db` (en el mismo directorio del script).
 
 from __future__ import annotations
 
+import atexit
+import linecache
+import operator
+import queue
+import re
 import sqlite3
-from dataclasses import dataclass
+import threading
+from array import array
+from itertools import compress, groupby
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional
 
 
 DB_PATH = Path(__file__).with_name("inventario.db")
 
+# PRAGMAs aplicados una sola vez al abrir la conexión compartida.
+# WAL + synchronous=NORMAL evitan el doble fsync del journal clásico en cada escritura.
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -64000;",
+    "PRAGMA busy_timeout = 5000;",
+    "PRAGMA foreign_keys = ON;",
+)
+
+# Sentencias SQL fijas: al ser siempre el mismo objeto str, la caché de sentencias
+# preparadas de sqlite3 las reutiliza sin volver a compilarlas.
+_SQL_SELECT_ALL = "SELECT id, nombre, cantidad, precio FROM productos ORDER BY id;"
+_SQL_SELECT_ONE = "SELECT id, nombre, cantidad, precio FROM productos WHERE id = ?;"
+_SQL_INSERT = "INSERT INTO productos (id, nombre, cantidad, precio) VALUES (?, ?, ?, ?);"
+_SQL_DELETE = "DELETE FROM productos WHERE id = ?;"
+_SQL_UPD_QTY = "UPDATE productos SET cantidad = ? WHERE id = ?;"
+_SQL_UPD_PRICE = "UPDATE productos SET precio = ? WHERE id = ?;"
+_SQL_BUSCAR_NOMBRE = "SELECT id FROM productos WHERE nombre LIKE ? ESCAPE '\\' ORDER BY id;"
+# Sin comodín inicial: SQLite resuelve el LIKE como rango sobre idx_productos_nombre_nocase
+_SQL_BUSCAR_PREFIJO = (
+    "SELECT id FROM productos WHERE nombre LIKE ? ESCAPE '\\' ORDER BY nombre COLLATE NOCASE;"
+)
+
+# Operaciones de escritura -> SQL (usado por Inventario y StorageWorker)
+_SQL_POR_OP = {
+    "insert": _SQL_INSERT,
+    "delete": _SQL_DELETE,
+    "upd_qty": _SQL_UPD_QTY,
+    "upd_price": _SQL_UPD_PRICE,
+    # params = lista de filas; se escriben todas o ninguna (alta masiva con StorageWorker)
+    "insert_many": _SQL_INSERT,
+}
+
+
+# ==============================
+# Kernels sobre columnas (SoA)
+# ==============================
+# Recorren los array contiguos con builtins implementados en C (map/sum/compress),
+# sin bucles a nivel de intérprete.
+
+def _total_value(cant: array, precio: array) -> float:
+    return float(sum(map(operator.mul, cant, precio)))
+
+
+def _low_stock_mask(cant: array, umbral: int) -> List[bool]:
+    return list(map(umbral.__gt__, cant))
+
 
 class DB:
     """Capa delgada para manejar la conexión SQLite y garantizar la tabla."""
 
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None  # Conexión única, abierta bajo demanda
+        atexit.register(self.close)
         self._ensure_schema()
 
-    def connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON;")
+    def conn(self) -> sqlite3.Connection:
+        """Devuelve la conexión compartida; la abre (y configura) solo la primera vez."""
+        if self._conn is None:
+            self._conn = self.conectar(check_same_thread=False)
+        return self._conn
+
+    def conectar(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Abre una conexión nueva con la configuración común (p. ej. para StorageWorker)."""
+        # isolation_level=None: autocommit. Cada sentencia suelta se confirma sola y las
+        # transacciones (altas masivas, StorageWorker) se abren con BEGIN/COMMIT explícitos.
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=check_same_thread,
+            cached_statements=256,
+        )
+        # Filas como tuplas simples (acceso posicional): el camino más rápido para el CRUD.
+        # Para consultas de depuración usar un cursor propio con cur.row_factory = sqlite3.Row.
+        conn.row_factory = None
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def _ensure_schema(self) -> None:
-        with self.connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS productos (
-                    id       INTEGER PRIMARY KEY,
-                    nombre   TEXT UNIQUE NOT NULL,
-                    cantidad INTEGER NOT NULL CHECK (cantidad >= 0),
-                    precio   REAL    NOT NULL CHECK (precio >= 0)
-                );
-                """
-            )
-            conn.commit()
-
-
-@dataclass(frozen=True)
-class ProductoSnapshot:
-    """Instantánea inmutable de un producto (ejemplo de tuple-like dataclass)."""
+        conn = self.conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS productos (
+                id       INTEGER PRIMARY KEY,
+                nombre   TEXT UNIQUE NOT NULL,
+                cantidad INTEGER NOT NULL CHECK (cantidad >= 0),
+                precio   REAL    NOT NULL CHECK (precio >= 0)
+            );
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_productos_nombre_nocase "
+            "ON productos(nombre COLLATE NOCASE);"
+        )
+
+
+class StorageWorker(threading.Thread):
+    """
+    Hilo escritor opcional: consume operaciones (op, params) de una cola y las agrupa en una
+    sola transacción con executemany por cada racha de operaciones iguales, de modo que quien
+    escribe no espera el fsync.
+
+    El hilo usa su propia conexión (abierta en run()), no la compartida de DB.conn(): así sus
+    transacciones no se mezclan con las escrituras en autocommit ni con las lecturas del hilo
+    principal, que con WAL leen el último estado confirmado sin bloquearse. Lo encolado y aún
+    no confirmado no es visible para esas lecturas hasta después de flush().
+
+    Los errores no llegan a quien encoló la operación: se acumulan y flush() relanza el
+    primero. En ese caso la memoria del Inventario puede haberse adelantado a la BD y
+    conviene recargarla con _load_from_db().
+    """
+
+    def __init__(self, db: DB, lote_max: int = 256):
+        super().__init__(name="StorageWorker", daemon=True)
+        self.db = db
+        self.lote_max = lote_max
+        self._q: queue.Queue = queue.Queue()
+        self._errores: List[Exception] = []
+        atexit.register(self.detener)
+
+    def submit(self, op: str, params: tuple) -> None:
+        if op not in _SQL_POR_OP:
+            raise ValueError(f"Operación de escritura desconocida: {op!r}.")
+        self._q.put((op, params))
+
+    def flush(self) -> None:
+        """Espera a que se escriba todo lo encolado; relanza el primer error ocurrido."""
+        if not self.is_alive() and not self._q.empty():
+            # Sin hilo que consuma la cola, join() esperaría para siempre
+            raise RuntimeError("StorageWorker no está en ejecución (¿falta llamar a start()?).")
+        self._q.join()
+        if self._errores:
+            error = self._errores[0]
+            self._errores.clear()
+            raise error
+
+    def detener(self) -> None:
+        if self.is_alive():
+            self._q.put(None)
+            self.join()
+
+    def run(self) -> None:
+        conn = self.db.conectar()
+        try:
+            while True:
+                lote = [self._q.get()]
+                while len(lote) < self.lote_max:
+                    try:
+                        lote.append(self._q.get_nowait())
+                    except queue.Empty:
+                        break
+                fin = None in lote
+                ops = [x for x in lote if x is not None]
+                try:
+                    if ops:
+                        self._escribir(conn, ops)
+                except Exception as e:
+                    # Se registra y se sigue drenando: un hilo muerto dejaría flush() colgado
+                    self._errores.append(e)
+                finally:
+                    for _ in lote:
+                        self._q.task_done()
+                if fin:
+                    return
+        finally:
+            conn.close()
+
+    def _escribir(self, conn: sqlite3.Connection, ops: List[tuple]) -> None:
+        try:
+            # IMMEDIATE toma el bloqueo de escritura al inicio (respetando busy_timeout)
+            conn.execute("BEGIN IMMEDIATE")
+            # groupby solo agrupa rachas consecutivas: se respeta el orden original
+            for op, grupo in groupby(ops, key=operator.itemgetter(0)):
+                if op == "insert_many":
+                    filas = [fila for _, params in grupo for fila in params]
+                else:
+                    filas = [params for _, params in grupo]
+                conn.executemany(_SQL_POR_OP[op], filas)
+            conn.execute("COMMIT")
+        except Exception as e:
+            # Cualquier fallo cierra la transacción: si quedara abierta retendría el bloqueo
+            # de escritura y el hilo principal acabaría con "database is locked".
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            if not isinstance(e, sqlite3.Error):
+                raise
+            # Reintento una a una para no perder las operaciones válidas del lote
+            for op, params in ops:
+                try:
+                    if op == "insert_many":
+                        self._insertar_todas(conn, params)
+                    else:
+                        conn.execute(_SQL_POR_OP[op], params)
+                except sqlite3.Error as e:
+                    self._errores.append(e)
+
+    @staticmethod
+    def _insertar_todas(conn: sqlite3.Connection, filas: List[tuple]) -> None:
+        """Alta masiva en su propia transacción: en autocommit executemany no sería atómico."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_SQL_INSERT, filas)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class ProductoSnapshot(NamedTuple):
+    """Instantánea inmutable de un producto (subclase de tuple, sin __dict__ por instancia)."""
     id: int
     nombre: str
     cantidad: int
     precio: float
 
     def to_tuple(self) -> tuple:
-        return (self.id, self.nombre, self.cantidad, self.precio)
+        # Ya es una tupla: se conserva por compatibilidad y devuelve la misma instancia
+        return self
 
 
 class Producto:
-    """Entidad de dominio con validaciones mediante propiedades."""
+    """
+    Entidad de dominio con __slots__ (sin __dict__ por instancia y acceso directo a atributos).
+    Las validaciones se hacen al construir y en los métodos de actualización del Inventario.
+    """
+
+    __slots__ = ("id", "nombre", "cantidad", "precio", "_fmt")
 
     def __init__(self, id: int, nombre: str, cantidad: int, precio: float):
-        self._id = None
-        self._nombre = None
-        self._cantidad = None
-        self._precio = None
-
-        # Asignar vía setters para validar
-        self.id = id
-        self.nombre = nombre
-        self.cantidad = cantidad
-        self.precio = precio
-
-    # --- ID ---
-    @property
-    def id(self) -> int:
-        return self._id
-
-    @id.setter
-    def id(self, value: int) -> None:
-        if not isinstance(value, int) or value <= 0:
+        self.id, self.nombre, self.cantidad, self.precio = self._validate(id, nombre, cantidad, precio)
+        self._fmt: Optional[str] = None  # Texto formateado en caché (ver Inventario.formatear_producto)
+
+    @classmethod
+    def _from_db(cls, row: tuple) -> Producto:
+        """Construcción rápida desde una fila de SQLite (ya validada por los CHECK de la tabla)."""
+        p = object.__new__(cls)
+        p.id, p.nombre, p.cantidad, p.precio = row
+        p._fmt = None
+        return p
+
+    # --- Validaciones ---
+    @classmethod
+    def _validate(cls, id: int, nombre: str, cantidad: int, precio: float) -> tuple:
+        """Valida y normaliza todos los campos; devuelve (id, nombre, cantidad, precio)."""
+        if not isinstance(id, int) or id <= 0:
             raise ValueError("ID debe ser un entero positivo.")
-        self._id = value
-
-    # --- Nombre ---
-    @property
-    def nombre(self) -> str:
-        return self._nombre
-
-    @nombre.setter
-    def nombre(self, value: str) -> None:
-        if not isinstance(value, str) or not value.strip():
+        if not isinstance(nombre, str) or not nombre.strip():
             raise ValueError("Nombre no puede estar vacío.")
-        self._nombre = value.strip()
-
-    # --- Cantidad ---
-    @property
-    def cantidad(self) -> int:
-        return self._cantidad
+        return (id, nombre.strip(), cls._validate_cantidad(cantidad), cls._validate_precio(precio))
 
-    @cantidad.setter
-    def cantidad(self, value: int) -> None:
+    @staticmethod
+    def _validate_cantidad(value: int) -> int:
         if not isinstance(value, int) or value < 0:
             raise ValueError("Cantidad debe ser un entero >= 0.")
-        self._cantidad = value
-
-    # --- Precio ---
-    @property
-    def precio(self) -> float:
-        return self._precio
+        return value
 
-    @precio.setter
-    def precio(self, value: float) -> None:
+    @staticmethod
+    def _validate_precio(value: float) -> float:
         try:
             val = float(value)
         except (TypeError, ValueError):
             raise ValueError("Precio debe ser numérico.")
         if val < 0:
             raise ValueError("Precio debe ser >= 0.")
-        self._precio = val
+        return val
 
     # utilidades
     def to_snapshot(self) -> ProductoSnapshot:
@@ -152,6 +334,79 @@ class Producto:
         return f"Producto(id={self.id}, nombre={self.nombre!r}, cantidad={self.cantidad}, precio={self.precio:.2f})"
 
 
+# ==============================
+# CRUD especializado (codegen)
+# ==============================
+# El esquema es fijo, así que las operaciones de escritura se generan una sola vez al importar
+# el módulo con el SQL incrustado como constante y sin despachar por tipo de operación.
+
+_PLANTILLAS_CRUD = {
+    "insert": """\
+def _do_insert(self, p):
+    params = (p.id, p.nombre, p.cantidad, p.precio)
+    w = self._worker
+    if w is None:
+        self.db.conn().execute({sql!r}, params)
+    else:
+        w.submit({op!r}, params)
+    self.items[p.id] = p
+    self._by_nombre[p.nombre] = p
+    self._nombres_lower[p.id] = p.nombre.lower()
+    self._col_agregar(p)
+""",
+    "delete": """\
+def _do_delete(self, id_):
+    params = (id_,)
+    w = self._worker
+    if w is None:
+        self.db.conn().execute({sql!r}, params)
+    else:
+        w.submit({op!r}, params)
+    del self._by_nombre[self.items.pop(id_).nombre]
+    del self._nombres_lower[id_]
+    self._col_quitar(id_)
+""",
+    "upd_qty": """\
+def _do_upd_qty(self, id_, valor):
+    params = (valor, id_)
+    w = self._worker
+    if w is None:
+        self.db.conn().execute({sql!r}, params)
+    else:
+        w.submit({op!r}, params)
+    p = self.items[id_]
+    p.cantidad = valor
+    p._fmt = None
+    self._cant[self._pos[id_]] = valor
+""",
+    "upd_price": """\
+def _do_upd_price(self, id_, valor):
+    params = (valor, id_)
+    w = self._worker
+    if w is None:
+        self.db.conn().execute({sql!r}, params)
+    else:
+        w.submit({op!r}, params)
+    p = self.items[id_]
+    p.precio = valor
+    p._fmt = None
+    self._precio[self._pos[id_]] = valor
+""",
+}
+
+
+def _generar_crud() -> tuple:
+    """Compila las funciones _do_* (una por operación) a partir de las plantillas."""
+    ns: dict = {}
+    for op, plantilla in _PLANTILLAS_CRUD.items():
+        src = plantilla.format(sql=_SQL_POR_OP[op], op=op)
+        archivo = f"<crud:{op}>"
+        # Registrar el fuente para que los tracebacks muestren las líneas generadas
+        linecache.cache[archivo] = (len(src), None, src.splitlines(keepends=True), archivo)
+        exec(compile(src, archivo, "exec"), ns)
+    return ns["_do_insert"], ns["_do_delete"], ns["_do_upd_qty"], ns["_do_upd_price"]
+
+
 class Inventario:
     """
     Inventario respaldado por:
@@ -159,95 +414,234 @@ class Inventario:
       - SQLite: tabla productos para persistencia.
     """
 
-    def __init__(self, db: Optional[DB] = None):
+    def __init__(self, db: Optional[DB] = None, worker: Optional[StorageWorker] = None):
         self.db = db or DB()
+        self._worker = worker  # Si se indica, las escrituras se encolan en segundo plano
         self.items: Dict[int, Producto] = {}  # Colección principal (dict)
-        self._nombres_usados: set[str] = set()  # Colección auxiliar (set)
+        self._by_nombre: Dict[str, Producto] = {}  # Índice por nombre exacto (nombre es UNIQUE)
+        self._nombres_lower: Dict[int, str] = {}  # Nombres en minúsculas precalculados para búsquedas
+        # Columnas paralelas (SoA) para agregados: una fila por producto, id -> fila en _pos.
+        # Las filas borradas quedan en cero y se reutilizan vía _libres (sin desplazar datos).
+        self._ids = array("q")
+        self._cant = array("q")
+        self._precio = array("d")
+        self._pos: Dict[int, int] = {}
+        self._libres: List[int] = []
         self._load_from_db()
 
     # --- Carga inicial ---
     def _load_from_db(self) -> None:
         self.items.clear()
-        self._nombres_usados.clear()
-        with self.db.connect() as conn:
-            cur = conn.execute("SELECT id, nombre, cantidad, precio FROM productos ORDER BY id;")
-            for row in cur.fetchall():
-                p = Producto(id=row[0], nombre=row[1], cantidad=row[2], precio=row[3])
-                self.items[p.id] = p
-                self._nombres_usados.add(p.nombre)
+        self._by_nombre.clear()
+        self._nombres_lower.clear()
+        self._col_reset()
+        conn = self.db.conn()
+        # Referencias locales: evitan buscar atributos/métodos en cada iteración
+        from_db = Producto._from_db
+        items_set = self.items.__setitem__
+        by_nombre_set = self._by_nombre.__setitem__
+        lower_set = self._nombres_lower.__setitem__
+        col_agregar = self._col_agregar
+        # El cursor se itera directamente: las filas llegan en streaming, sin lista intermedia
+        for row in conn.execute(_SQL_SELECT_ALL):
+            p = from_db(row)
+            items_set(p.id, p)
+            by_nombre_set(p.nombre, p)
+            lower_set(p.id, p.nombre.lower())
+            col_agregar(p)
+
+    def _reload_one(self, id_: int) -> None:
+        """Resincroniza un solo producto con la BD (p. ej. tras una escritura externa)."""
+        row = self.db.conn().execute(_SQL_SELECT_ONE, (id_,)).fetchone()
+        p = self.items.get(id_)
+        if p is not None:
+            # Solo se borra la entrada si es de este producto: otro pudo haberla tomado ya
+            if self._by_nombre.get(p.nombre) is p:
+                del self._by_nombre[p.nombre]
+            del self._nombres_lower[id_]
+            self._col_quitar(id_)
+            if row is None:
+                del self.items[id_]
+                return
+            # Se actualiza en el sitio para no invalidar referencias existentes al objeto
+            _, p.nombre, p.cantidad, p.precio = row
+            p._fmt = None
+        elif row is None:
+            return
+        else:
+            p = Producto._from_db(row)
+            self.items[id_] = p
+        # Si otro producto ocupa el nombre en memoria, está desactualizado (nombre es UNIQUE en
+        # la BD): se recarga también para que el índice quede consistente.
+        anterior = self._by_nombre.get(p.nombre)
+        self._by_nombre[p.nombre] = p
+        self._nombres_lower[id_] = p.nombre.lower()
+        self._col_agregar(p)
+        if anterior is not None and anterior is not p:
+            self._reload_one(anterior.id)
+
+    # --- Columnas SoA ---
+    def _col_reset(self) -> None:
+        del self._ids[:], self._cant[:], self._precio[:]
+        self._pos.clear()
+        self._libres.clear()
+
+    def _col_agregar(self, p: Producto) -> None:
+        if self._libres:
+            fila = self._libres.pop()
+            self._ids[fila] = p.id
+            self._cant[fila] = p.cantidad
+            self._precio[fila] = p.precio
+        else:
+            # array.append crece con sobreasignación amortizada
+            fila = len(self._ids)
+            self._ids.append(p.id)
+            self._cant.append(p.cantidad)
+            self._precio.append(p.precio)
+        self._pos[p.id] = fila
+
+    def _col_quitar(self, id_: int) -> None:
+        fila = self._pos.pop(id_)
+        self._ids[fila] = 0
+        self._cant[fila] = 0
+        self._precio[fila] = 0.0
+        self._libres.append(fila)
+
+    # --- Escritura ---
+    # Escriben en la BD (o encolan en el StorageWorker) y actualizan la memoria; sin validar.
+    _do_insert, _do_delete, _do_upd_qty, _do_upd_price = _generar_crud()
+
+    def flush(self) -> None:
+        """Con StorageWorker, espera a que las escrituras encoladas lleguen a la BD."""
+        if self._worker is not None:
+            self._worker.flush()
 
     # --- CRUD ---
     def add_producto(self, p: Producto) -> None:
         if p.id in self.items:
             raise ValueError(f"Ya existe un producto con ID {p.id}.")
-        if p.nombre in self._nombres_usados:
+        if p.nombre in self._by_nombre:
             raise ValueError(f"Ya existe un producto con nombre '{p.nombre}'.")
 
-        with self.db.connect() as conn:
-            conn.execute(
-                "INSERT INTO productos (id, nombre, cantidad, precio) VALUES (?, ?, ?, ?);",
-                (p.id, p.nombre, p.cantidad, p.precio),
-            )
-            conn.commit()
-
-        self.items[p.id] = p
-        self._nombres_usados.add(p.nombre)
+        self._do_insert(p)
+
+    def add_productos(self, ps: Iterable[Producto]) -> None:
+        """
+        Alta masiva: una sola transacción con executemany (un único commit/fsync); se
+        insertan todas las filas o ninguna.
+
+        Con StorageWorker el lote viaja como una sola operación "insert_many", que sigue
+        siendo atómica en la BD, pero la memoria se actualiza al encolar: si flush() relanza
+        un error, hay que recargar con _load_from_db().
+        """
+        nuevos = list(ps)
+        ids: set[int] = set()
+        nombres: set[str] = set()
+        for p in nuevos:
+            if p.id in self.items or p.id in ids:
+                raise ValueError(f"Ya existe un producto con ID {p.id}.")
+            if p.nombre in self._by_nombre or p.nombre in nombres:
+                raise ValueError(f"Ya existe un producto con nombre '{p.nombre}'.")
+            ids.add(p.id)
+            nombres.add(p.nombre)
+
+        filas = [(p.id, p.nombre, p.cantidad, p.precio) for p in nuevos]
+        if self._worker is not None:
+            self._worker.submit("insert_many", filas)
+        else:
+            conn = self.db.conn()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(_SQL_INSERT, filas)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+
+        # Sin worker, aquí la transacción ya está confirmada; con worker, solo encolada
+        for p in nuevos:
+            self.items[p.id] = p
+            self._by_nombre[p.nombre] = p
+            self._nombres_lower[p.id] = p.nombre.lower()
+            self._col_agregar(p)
 
     def remove_producto(self, id_: int) -> None:
         if id_ not in self.items:
             raise KeyError(f"No existe producto con ID {id_}.")
-        nombre = self.items[id_].nombre
-
-        with self.db.connect() as conn:
-            conn.execute("DELETE FROM productos WHERE id = ?;", (id_,))
-            conn.commit()
 
-        del self.items[id_]
-        self._nombres_usados.discard(nombre)
+        self._do_delete(id_)
 
     def update_cantidad(self, id_: int, nueva_cantidad: int) -> None:
         if id_ not in self.items:
             raise KeyError(f"No existe producto con ID {id_}.")
-        if not isinstance(nueva_cantidad, int) or nueva_cantidad < 0:
-            raise ValueError("La nueva cantidad debe ser un entero >= 0.")
-
-        with self.db.connect() as conn:
-            conn.execute("UPDATE productos SET cantidad = ? WHERE id = ?;", (nueva_cantidad, id_))
-            conn.commit()
-
-        self.items[id_].cantidad = nueva_cantidad
+        self._do_upd_qty(id_, Producto._validate_cantidad(nueva_cantidad))
 
     def update_precio(self, id_: int, nuevo_precio: float) -> None:
         if id_ not in self.items:
             raise KeyError(f"No existe producto con ID {id_}.")
-        try:
-            nuevo = float(nuevo_precio)
-        except (TypeError, ValueError):
-            raise ValueError("El nuevo precio debe ser numérico.")
-        if nuevo < 0:
-            raise ValueError("El nuevo precio debe ser >= 0.")
-
-        with self.db.connect() as conn:
-            conn.execute("UPDATE productos SET precio = ? WHERE id = ?;", (nuevo, id_))
-            conn.commit()
-
-        self.items[id_].precio = nuevo
+        self._do_upd_price(id_, Producto._validate_precio(nuevo_precio))
 
     # --- Consultas ---
+    def get_by_nombre(self, nombre: str) -> Optional[Producto]:
+        """Búsqueda O(1) por nombre exacto."""
+        return self._by_nombre.get(nombre)
+
     def buscar_por_nombre(self, texto: str) -> List[Producto]:
         """Búsqueda en memoria por coincidencia parcial (case-insensitive)."""
         if not texto:
             return []
         t = texto.lower()
-        return [p for p in self.items.values() if t in p.nombre.lower()]
+        items = self.items
+        return [items[i] for i, low in self._nombres_lower.items() if t in low]
+
+    @staticmethod
+    def _escapar_like(texto: str) -> str:
+        return texto.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def buscar_por_nombre_sql(self, texto: str) -> List[Producto]:
+        """
+        Variante que delega el filtrado a SQLite (LIKE, en C); recorre toda la tabla.
+        Devuelve los Producto ya cacheados en memoria, sin reinstanciarlos.
+        Nota: LIKE solo ignora mayúsculas/minúsculas en caracteres ASCII.
+        """
+        if not texto:
+            return []
+        patron = "%" + self._escapar_like(texto) + "%"
+        cur = self.db.conn().execute(_SQL_BUSCAR_NOMBRE, (patron,))
+        return [self.items[row[0]] for row in cur if row[0] in self.items]
+
+    def buscar_por_prefijo(self, texto: str) -> List[Producto]:
+        """
+        Productos cuyo nombre empieza por `texto` (sin distinguir mayúsculas ASCII), en orden
+        alfabético. Usa el índice NOCASE sobre nombre, así que no recorre toda la tabla.
+        """
+        if not texto:
+            return []
+        patron = self._escapar_like(texto) + "%"
+        cur = self.db.conn().execute(_SQL_BUSCAR_PREFIJO, (patron,))
+        return [self.items[row[0]] for row in cur if row[0] in self.items]
 
     def listar_todos(self) -> List[Producto]:
         return list(self.items.values())
 
+    def valor_total(self) -> float:
+        """Valor del stock (cantidad * precio) calculado sobre las columnas contiguas."""
+        return _total_value(self._cant, self._precio)
+
+    def productos_bajo_stock(self, umbral: int) -> List[Producto]:
+        """Productos con cantidad < umbral, en el orden de las columnas."""
+        mask = _low_stock_mask(self._cant, umbral)
+        # Las filas libres tienen id 0: se descartan aunque su cantidad sea 0
+        return [self.items[i] for i in compress(self._ids, mask) if i]
+
     # --- Helpers de presentación ---
     @staticmethod
     def formatear_producto(p: Producto) -> str:
-        return f"[{p.id}] {p.nombre} — Cant: {p.cantidad} — Precio: ${p.precio:.2f}"
+        """Formatea una sola vez y reutiliza el texto hasta que cambie cantidad o precio."""
+        fmt = p._fmt
+        if fmt is None:
+            fmt = p._fmt = f"[{p.id}] {p.nombre} — Cant: {p.cantidad} — Precio: ${p.precio:.2f}"
+        return fmt
 
     def imprimir_todos(self) -> None:
         productos = self.listar_todos()
@@ -264,20 +658,25 @@ class Inventario:
 # Interfaz de usuario (consola)
 # ==============================
 
+# Validadores precompilados: descartan entradas inválidas sin pasar por excepciones.
+_INT_RE = re.compile(r"^[+-]?\d+$")
+_FLOAT_RE = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$")
+
+
 def input_int(prompt: str) -> int:
     while True:
-        try:
-            return int(input(prompt).strip())
-        except ValueError:
-            print("⚠️  Ingresa un número entero válido.")
+        s = input(prompt).strip()
+        if _INT_RE.match(s):
+            return int(s)
+        print("⚠️  Ingresa un número entero válido.")
 
 
 def input_float(prompt: str) -> float:
     while True:
-        try:
-            return float(input(prompt).strip())
-        except ValueError:
-            print("⚠️  Ingresa un número (usa punto decimal).")
+        s = input(prompt).strip()
+        if _FLOAT_RE.match(s):
+            return float(s)
+        print("⚠️  Ingresa un número (usa punto decimal).")
 
 
 def menu():
@@ -290,6 +689,8 @@ def menu():
         "4": "Actualizar precio",
         "5": "Buscar por nombre",
         "6": "Mostrar todos los productos",
+        "7": "Valor total del inventario",
+        "8": "Productos con bajo stock",
         "0": "Salir",
     }
 
@@ -345,6 +746,21 @@ def menu():
             elif op == "6":
                 inv.imprimir_todos()
 
+            elif op == "7":
+                print(f"\n💰 Valor total del inventario: ${inv.valor_total():.2f}\n")
+
+            elif op == "8":
+                print("\n>> Productos con bajo stock")
+                umbral = input_int("Mostrar cantidades menores a: ")
+                resultados = inv.productos_bajo_stock(umbral)
+                if resultados:
+                    print(f"\nResultados ({len(resultados)}):")
+                    for p in resultados:
+                        print(Inventario.formatear_producto(p))
+                    print("")
+                else:
+                    print("Sin productos bajo ese umbral.\n")
+
             elif op == "0":
                 print("¡Hasta pronto!")
                 break
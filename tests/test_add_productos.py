@@ -0,0 +1,65 @@
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from main import DB, Inventario, Producto  # noqa: E402
+
+
+class AddProductosTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DB(Path(self._tmp.name) / "test.db")
+        self.inv = Inventario(self.db)
+        self.inv.add_producto(Producto(1, "Cocina", 2, 10.0))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def ids_en_bd(self):
+        return [r[0] for r in self.db.conn().execute("SELECT id FROM productos ORDER BY id;")]
+
+    def estado_memoria(self):
+        inv = self.inv
+        return (dict(inv.items), dict(inv._by_nombre), dict(inv._nombres_lower), inv.valor_total())
+
+    def test_inserta_todo_el_lote(self):
+        self.inv.add_productos(Producto(i, f"P{i}", 1, 1.5) for i in range(2, 12))
+        self.assertEqual(self.ids_en_bd(), list(range(1, 12)))
+        self.assertIs(self.inv.get_by_nombre("P5"), self.inv.items[5])
+        self.assertEqual(self.inv.valor_total(), 20.0 + 10 * 1.5)
+
+    def test_duplicado_en_bd_revierte_el_lote_y_no_toca_la_memoria(self):
+        # Fila escrita por fuera del Inventario: la memoria no la conoce
+        self.db.conectar().execute("INSERT INTO productos VALUES (50, 'P4', 1, 1.0);")
+        antes = self.estado_memoria()
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.inv.add_productos(Producto(i, f"P{i}", 1, 1.0) for i in range(2, 8))
+
+        self.assertEqual(self.ids_en_bd(), [1, 50])
+        self.assertEqual(self.estado_memoria(), antes)
+        self.assertFalse(self.db.conn().in_transaction)
+
+    def test_repetidos_dentro_del_lote_se_rechazan_antes_de_escribir(self):
+        antes = self.estado_memoria()
+        lotes = [
+            [Producto(2, "A", 1, 1.0), Producto(2, "B", 1, 1.0)],  # ID repetido
+            [Producto(2, "A", 1, 1.0), Producto(3, "A", 1, 1.0)],  # nombre repetido
+            [Producto(2, "A", 1, 1.0), Producto(1, "B", 1, 1.0)],  # ID ya en memoria
+            [Producto(2, "A", 1, 1.0), Producto(3, "Cocina", 1, 1.0)],  # nombre ya en memoria
+        ]
+        for lote in lotes:
+            with self.subTest(lote=lote), self.assertRaises(ValueError):
+                self.inv.add_productos(lote)
+
+        self.assertEqual(self.ids_en_bd(), [1])
+        self.assertEqual(self.estado_memoria(), antes)
+
+
+if __name__ == "__main__":
+    unittest.main()
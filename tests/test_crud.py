@@ -0,0 +1,77 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from main import DB, Inventario, Producto  # noqa: E402
+
+
+class CrudGeneradoTest(unittest.TestCase):
+    """Los métodos _do_* se generan con exec(): se comprueba BD y memoria en cada uno."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DB(Path(self._tmp.name) / "test.db")
+        self.inv = Inventario(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def fila(self, id_):
+        return self.db.conn().execute(
+            "SELECT id, nombre, cantidad, precio FROM productos WHERE id = ?;", (id_,)
+        ).fetchone()
+
+    def test_nombres_de_archivo_de_los_metodos_generados(self):
+        for op, metodo in [
+            ("insert", Inventario._do_insert),
+            ("delete", Inventario._do_delete),
+            ("upd_qty", Inventario._do_upd_qty),
+            ("upd_price", Inventario._do_upd_price),
+        ]:
+            self.assertEqual(metodo.__code__.co_filename, f"<crud:{op}>")
+
+    def test_do_insert(self):
+        p = Producto(1, "Cocina", 3, 10.0)
+        self.inv._do_insert(p)
+        self.assertEqual(self.fila(1), (1, "Cocina", 3, 10.0))
+        self.assertIs(self.inv.items[1], p)
+        self.assertIs(self.inv.get_by_nombre("Cocina"), p)
+        self.assertEqual(self.inv.buscar_por_nombre("coc"), [p])
+        self.assertEqual(self.inv.valor_total(), 30.0)
+
+    def test_do_delete(self):
+        self.inv._do_insert(Producto(1, "Cocina", 3, 10.0))
+        self.inv._do_delete(1)
+        self.assertIsNone(self.fila(1))
+        self.assertNotIn(1, self.inv.items)
+        self.assertIsNone(self.inv.get_by_nombre("Cocina"))
+        self.assertEqual(self.inv.buscar_por_nombre("coc"), [])
+        self.assertEqual(self.inv.valor_total(), 0.0)
+
+    def test_do_upd_qty(self):
+        p = Producto(1, "Cocina", 3, 10.0)
+        self.inv._do_insert(p)
+        Inventario.formatear_producto(p)
+        self.inv._do_upd_qty(1, 5)
+        self.assertEqual(self.fila(1)[2], 5)
+        self.assertEqual(p.cantidad, 5)
+        self.assertIn("Cant: 5", Inventario.formatear_producto(p))
+        self.assertEqual(self.inv.valor_total(), 50.0)
+
+    def test_do_upd_price(self):
+        p = Producto(1, "Cocina", 3, 10.0)
+        self.inv._do_insert(p)
+        Inventario.formatear_producto(p)
+        self.inv._do_upd_price(1, 2.5)
+        self.assertEqual(self.fila(1)[3], 2.5)
+        self.assertEqual(p.precio, 2.5)
+        self.assertIn("$2.50", Inventario.formatear_producto(p))
+        self.assertEqual(self.inv.valor_total(), 7.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from main import DB, Inventario, Producto  # noqa: E402
+
+
+class ReloadOneTest(unittest.TestCase):
+    """_reload_one tras escrituras hechas fuera del Inventario (otra herramienta/conexión)."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DB(Path(self._tmp.name) / "test.db")
+        self.inv = Inventario(self.db)
+        self.inv.add_productos(Producto(i, f"Prod{i}", i, 10.0) for i in range(1, 6))
+        self.externa = self.db.conectar()
+
+    def tearDown(self):
+        self.externa.close()
+        self.db.close()
+        self._tmp.cleanup()
+
+    def assertIndicesConsistentes(self):
+        inv = self.inv
+        self.assertEqual({p.nombre: p for p in inv.items.values()}, inv._by_nombre)
+        self.assertEqual({i: p.nombre.lower() for i, p in inv.items.items()}, inv._nombres_lower)
+        self.assertEqual(set(inv.items), set(inv._pos))
+        esperado = sum(p.cantidad * p.precio for p in inv.items.values())
+        self.assertAlmostEqual(inv.valor_total(), esperado)
+
+    def test_fila_actualizada_externamente(self):
+        p = self.inv.items[2]
+        Inventario.formatear_producto(p)
+        self.externa.execute(
+            "UPDATE productos SET nombre = 'Cocina', cantidad = 7, precio = 3.5 WHERE id = 2;"
+        )
+        self.inv._reload_one(2)
+
+        self.assertIs(self.inv.items[2], p)  # se actualiza en el sitio
+        self.assertEqual((p.nombre, p.cantidad, p.precio), ("Cocina", 7, 3.5))
+        self.assertIn("Cant: 7", Inventario.formatear_producto(p))
+        self.assertIsNone(self.inv.get_by_nombre("Prod2"))
+        self.assertEqual(self.inv.buscar_por_nombre("cocina"), [p])
+        self.assertIndicesConsistentes()
+
+    def test_fila_insertada_externamente(self):
+        self.externa.execute("INSERT INTO productos VALUES (9, 'Nuevo', 2, 4.0);")
+        self.inv._reload_one(9)
+
+        self.assertEqual(self.inv.items[9].to_snapshot(), (9, "Nuevo", 2, 4.0))
+        self.assertIs(self.inv.get_by_nombre("Nuevo"), self.inv.items[9])
+        self.assertIndicesConsistentes()
+
+    def test_fila_borrada_externamente(self):
+        self.externa.execute("DELETE FROM productos WHERE id = 3;")
+        self.inv._reload_one(3)
+
+        self.assertNotIn(3, self.inv.items)
+        self.assertIsNone(self.inv.get_by_nombre("Prod3"))
+        self.assertIndicesConsistentes()
+
+    def test_id_inexistente_no_hace_nada(self):
+        self.inv._reload_one(99)
+        self.assertEqual(sorted(self.inv.items), [1, 2, 3, 4, 5])
+        self.assertIndicesConsistentes()
+
+    def test_nombres_intercambiados_entre_dos_productos(self):
+        self.externa.execute("UPDATE productos SET nombre = 'tmp' WHERE id = 1;")
+        self.externa.execute("UPDATE productos SET nombre = 'Prod1' WHERE id = 2;")
+        self.externa.execute("UPDATE productos SET nombre = 'Prod2' WHERE id = 1;")
+        self.inv._reload_one(1)
+
+        self.assertEqual(self.inv.items[1].nombre, "Prod2")
+        self.assertEqual(self.inv.items[2].nombre, "Prod1")
+        self.assertIs(self.inv.get_by_nombre("Prod1"), self.inv.items[2])
+        self.assertIs(self.inv.get_by_nombre("Prod2"), self.inv.items[1])
+        self.assertIndicesConsistentes()
+
+    def test_renombrado_externo_que_reutiliza_un_nombre(self):
+        self.externa.execute("UPDATE productos SET nombre = 'tmp' WHERE id = 4;")
+        self.externa.execute("UPDATE productos SET nombre = 'Prod4' WHERE id = 5;")
+        self.inv._reload_one(5)
+
+        self.assertIs(self.inv.get_by_nombre("Prod4"), self.inv.items[5])
+        self.assertEqual(self.inv.items[4].nombre, "tmp")
+        self.assertIndicesConsistentes()
+
+        self.inv.remove_producto(4)
+        self.inv.remove_producto(5)
+        self.assertEqual(sorted(self.inv.items), [1, 2, 3])
+        self.assertIndicesConsistentes()
+
+
+if __name__ == "__main__":
+    unittest.main()
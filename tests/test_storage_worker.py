@@ -0,0 +1,125 @@
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from main import DB, Inventario, Producto, StorageWorker  # noqa: E402
+
+
+class StorageWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = DB(Path(self._tmp.name) / "test.db")
+        self.worker = StorageWorker(self.db, lote_max=64)
+        self.worker.start()
+
+    def tearDown(self):
+        self.worker.detener()
+        self.db.close()
+        self._tmp.cleanup()
+
+    def filas(self):
+        return self.db.conn().execute(
+            "SELECT id, nombre, cantidad, precio FROM productos ORDER BY id;"
+        ).fetchall()
+
+    def test_respeta_el_orden_de_las_operaciones(self):
+        w = self.worker
+        w.submit("insert", (1, "Cocina", 1, 10.0))
+        w.submit("upd_qty", (5, 1))
+        w.submit("delete", (1,))
+        w.submit("insert", (1, "Cocina nueva", 2, 20.0))
+        w.submit("upd_price", (25.0, 1))
+        w.submit("upd_qty", (7, 1))
+        w.flush()
+        self.assertEqual(self.filas(), [(1, "Cocina nueva", 7, 25.0)])
+
+    def test_flush_relanza_errores_sin_perder_operaciones_validas(self):
+        w = self.worker
+        w.submit("insert", (1, "A", 1, 1.0))
+        w.submit("insert", (2, "A", 1, 1.0))  # nombre duplicado
+        w.submit("insert", (3, "B", 1, 1.0))
+        with self.assertRaises(sqlite3.IntegrityError):
+            w.flush()
+        self.assertEqual([f[0] for f in self.filas()], [1, 3])
+
+        # El error ya se entregó y el hilo sigue vivo para nuevas escrituras
+        w.flush()
+        self.assertTrue(w.is_alive())
+        w.submit("insert", (4, "C", 1, 1.0))
+        w.flush()
+        self.assertEqual([f[0] for f in self.filas()], [1, 3, 4])
+
+    def test_submit_rechaza_operaciones_desconocidas(self):
+        with self.assertRaises(ValueError):
+            self.worker.submit("bogus", (1,))
+
+    def test_error_no_sqlite_no_deja_la_transaccion_abierta(self):
+        w = self.worker
+        w.submit("insert", (1, "A", 1, 1.0))
+        w._q.put(("bogus", ()))  # se salta la validación de submit()
+        with self.assertRaises(KeyError):
+            w.flush()
+
+        # Sin bloqueo retenido por el hilo, la escritura síncrona no espera al busy_timeout
+        conn = self.db.conn()
+        conn.execute("PRAGMA busy_timeout = 300;")
+        conn.execute("INSERT INTO productos VALUES (2, 'B', 1, 1.0);")
+        self.assertEqual([f[0] for f in self.filas()], [2])
+
+    def test_alta_masiva_con_worker_es_atomica(self):
+        inv = Inventario(self.db, worker=self.worker)
+        self.worker.submit("insert", (1, "A", 1, 1.0))
+        # Mayor que lote_max: aun así viaja como una sola operación
+        inv.add_productos(Producto(i, f"P{i}", 1, 1.0) for i in range(100, 400))
+        self.worker.submit("insert", (2, "B", 1, 1.0))
+        inv.flush()
+        self.assertEqual(len(self.filas()), 302)
+
+        # Un nombre que ya existe en la BD (escrito por fuera) hace fallar todo el lote
+        self.db.conn().execute("INSERT INTO productos VALUES (5000, 'Q450', 1, 1.0);")
+        inv.add_productos(Producto(i, f"Q{i}", 1, 1.0) for i in range(400, 500))
+        self.worker.submit("insert", (3, "C", 1, 1.0))
+        with self.assertRaises(sqlite3.IntegrityError):
+            inv.flush()
+        ids = {f[0] for f in self.filas()}
+        self.assertFalse(ids & set(range(400, 500)))
+        self.assertIn(3, ids)
+
+    def test_uso_concurrente_con_escrituras_sincronas(self):
+        inv_async = Inventario(self.db, worker=self.worker)
+        inv_sync = Inventario(self.db)
+
+        def productores(base):
+            for i in range(200):
+                self.worker.submit("insert", (base + i, f"T{base + i}", 1, 1.0))
+
+        hilos = [threading.Thread(target=productores, args=(b,)) for b in (10_000, 20_000)]
+        for h in hilos:
+            h.start()
+        inv_async.add_productos(Producto(i, f"P{i}", i, 1.0) for i in range(1, 501))
+        # Alta masiva síncrona y lecturas en la conexión compartida mientras el hilo escribe
+        for base in range(1000, 1500, 100):
+            inv_sync.add_productos(Producto(base + i, f"S{base + i}", 1, 2.0) for i in range(100))
+            inv_sync.buscar_por_nombre_sql("S")
+        for h in hilos:
+            h.join()
+        inv_async.flush()
+
+        self.assertTrue(self.worker.is_alive())
+        total = self.db.conn().execute("SELECT COUNT(*) FROM productos;").fetchone()[0]
+        self.assertEqual(total, 500 + 500 + 400)
+
+    def test_flush_sin_start_no_se_bloquea(self):
+        parado = StorageWorker(self.db)
+        parado.submit("insert", (1, "A", 1, 1.0))
+        with self.assertRaises(RuntimeError):
+            parado.flush()
+
+
+if __name__ == "__main__":
+    unittest.main()